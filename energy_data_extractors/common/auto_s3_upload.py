@@ -2,8 +2,12 @@
 """Auto S3 Upload"""
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+import functools
 import os
 import logging
+import threading
 from datetime import datetime
 import re
 from dotenv import load_dotenv, find_dotenv
@@ -21,6 +25,49 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+# Large parquet/zip uploads go up as parallel 8 MB parts; smaller files stay a single PUT
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# One S3 client per credential set, shared by every uploader (boto3 clients are thread-safe)
+_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _build_s3_client(aws_profile, aws_access_key, aws_secret_key, aws_region):
+    # A dedicated Session per build: the default boto3 session is not safe to
+    # create clients from concurrently (extractors are constructed in threads)
+    if aws_profile:
+        session = boto3.session.Session(profile_name=aws_profile, region_name=aws_region)
+    elif aws_access_key and aws_secret_key:
+        session = boto3.session.Session(
+            aws_access_key_id=aws_access_key,
+            aws_secret_access_key=aws_secret_key,
+            region_name=aws_region
+        )
+    else:
+        session = boto3.session.Session(region_name=aws_region)
+    # Pool sized for several concurrent multipart transfers on the shared client
+    config = Config(max_pool_connections=32)
+    return session.client('s3', config=config)
+
+def get_s3_client(aws_profile=None, aws_access_key=None, aws_secret_key=None, aws_region='us-east-1'):
+    """Return the shared S3 client for the given credentials, creating it on first use"""
+    with _client_lock:
+        return _build_s3_client(aws_profile, aws_access_key, aws_secret_key, aws_region)
+
+@functools.lru_cache(maxsize=None)
+def _check_bucket(s3_client, bucket_name):
+    # Head on bucket to verify access if bucket exists; done once per client/bucket
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+    except Exception:
+        # Don't disable; bucket might not exist yet or permissions limited
+        pass
+
 class AutoS3Uploader:
     def __init__(self):
         # Load AWS credentials from environment variables (support alternate keys)
@@ -32,27 +79,12 @@ class AutoS3Uploader:
         
         try:
             # Prefer explicit keys if provided; otherwise use default credential chain (env, shared config, IAM, etc.)
-            if self.aws_profile:
-                session = boto3.Session(profile_name=self.aws_profile, region_name=self.aws_region)
-                self.s3_client = session.client('s3')
-            elif self.aws_access_key and self.aws_secret_key:
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.aws_access_key,
-                    aws_secret_access_key=self.aws_secret_key,
-                    region_name=self.aws_region
-                )
-            else:
-                self.s3_client = boto3.client('s3', region_name=self.aws_region)
+            self.s3_client = get_s3_client(self.aws_profile, self.aws_access_key,
+                                           self.aws_secret_key, self.aws_region)
 
             # Optional: validate access by a lightweight call
-            try:
-                # Head on bucket to verify access if bucket exists
-                if self.bucket_name:
-                    self.s3_client.head_bucket(Bucket=self.bucket_name)
-            except Exception:
-                # Don't disable; bucket might not exist yet or permissions limited
-                pass
+            if self.bucket_name:
+                _check_bucket(self.s3_client, self.bucket_name)
 
             self.enabled = True
             logger.info("✅ Auto S3 upload enabled (credentials resolved)")
@@ -205,7 +237,7 @@ class AutoS3Uploader:
             # If caller provided a full S3 key under our namespace, honor it exactly
             if isinstance(original_filename, str) and original_filename.startswith('dsm_data/'):
                 s3_key = original_filename
-                self.s3_client.upload_file(local_path, self.bucket_name, s3_key)
+                self.s3_client.upload_file(local_path, self.bucket_name, s3_key, Config=TRANSFER_CONFIG)
                 logger.info(f"📤 Uploaded to s3://{s3_key}")
                 # Assume caller manages parquet generation for pre-partitioned paths
                 return True
@@ -218,7 +250,7 @@ class AutoS3Uploader:
             s3_key = f"dsm_data/raw/{region}/{date_str}/{readable_filename}"
             
             # Upload raw file
-            self.s3_client.upload_file(local_path, self.bucket_name, s3_key)
+            self.s3_client.upload_file(local_path, self.bucket_name, s3_key, Config=TRANSFER_CONFIG)
             logger.info(f"📤 Auto-uploaded: {readable_filename} to raw/{region}/")
             
             # Optional auto-convert to parquet (disabled by default). Enable with AUTO_S3_PARQUET=true
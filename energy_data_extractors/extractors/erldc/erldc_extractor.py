@@ -117,7 +117,8 @@ class ERLDCDynamicExtractor:
             logger.info("🔍 Discovering ERLDC entities dynamically...")
             
             # Check if we have existing ERLDC data to analyze
-            existing_data_path = Path("../../final_output/cleanup/original_data_backup/ERLDC")
+            # Anchored to this file (not the CWD) so drivers need not chdir here
+            existing_data_path = Path(__file__).resolve().parents[2] / "final_output/cleanup/original_data_backup/ERLDC"
             if existing_data_path.exists():
                 entities = set()
                 for file_path in existing_data_path.glob("*.csv"):
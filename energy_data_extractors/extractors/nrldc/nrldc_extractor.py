@@ -17,7 +17,12 @@ from typing import Optional, List, Dict
 from bs4 import BeautifulSoup
 import json
 import typing
+import functools
 import numpy as np
+try:
+    import orjson  # Optional: faster parsing of the station mapping JSON files
+except ImportError:
+    orjson = None
 
 # Add common module to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'common'))
@@ -29,6 +34,13 @@ from nrldc_region_mapper import NRLDCRegionMapper
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=8)
+def _load_json_file(path_str: str, mtime_ns: int):
+    # mtime_ns is part of the cache key so an edited mapping file is re-read
+    with open(path_str, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 class NRLDCWorkingDSAExtractor:
     def __init__(self):
         self.base_url = "http://164.100.60.165"
@@ -1139,8 +1151,7 @@ class NRLDCWorkingDSAExtractor:
                 logger.error(f"❌ Comprehensive mapping not found: {mapping_file}")
                 return False
             
-            with open(mapping_file, 'r') as f:
-                station_mapping = json.load(f)
+            station_mapping = self._load_mapping_json(mapping_file)
             
             logger.info(f"📊 Loaded comprehensive mapping for {len(station_mapping)} stations")
             
@@ -1260,8 +1271,7 @@ class NRLDCWorkingDSAExtractor:
                 logger.error(f"❌ Comprehensive mapping not found: {mapping_file}")
                 return False
             
-            with open(mapping_file, 'r') as f:
-                station_mapping = json.load(f)
+            station_mapping = self._load_mapping_json(mapping_file)
             
             # Load the XLS file to get actual data - use latest available file
             xls_files = list(self.local_data_dir.glob("Supporting_files_*.xls"))
@@ -1455,6 +1465,10 @@ class NRLDCWorkingDSAExtractor:
             traceback.print_exc()
             return False
 
+    def _load_mapping_json(self, mapping_file: Path):
+        """Parse a station mapping JSON file, reusing the parsed result while the file is unchanged."""
+        return _load_json_file(str(mapping_file), mapping_file.stat().st_mtime_ns)
+
     def _sanitize_for_parquet(self, df_in: pd.DataFrame) -> pd.DataFrame:
         """Coerce mostly-numeric columns to float; cast others to string to avoid mixed-type parquet errors."""
         try:
@@ -1589,8 +1603,7 @@ class NRLDCWorkingDSAExtractor:
             try:
                 mapping_path = Path('energy_data_extractors/master_data/NRLDC/station_mapping.json')
                 if mapping_path.exists():
-                    with open(mapping_path, 'r') as f:
-                        raw_map = json.load(f)
+                    raw_map = self._load_mapping_json(mapping_path)
                     for k, v in raw_map.items():
                         alias_map[_canonicalize(k)] = _canonicalize(v)
             except Exception as e:
@@ -17,6 +17,12 @@ from bs4 import BeautifulSoup
 import json
 import zipfile
 import io
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import orjson  # Optional: faster JSON parsing of the API payload
+except ImportError:
+    orjson = None
 # Add common module to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'common'))
 from auto_s3_upload import AutoS3Uploader
@@ -24,6 +30,10 @@ from auto_s3_upload import AutoS3Uploader
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Direct data file extensions (PDFs are skipped as they don't contain extractable data)
+_FILE_EXTS = ('.zip', '.xlsx', '.csv')
+_FILE_EXT_RE = re.compile(r'\.(xlsx|csv|zip)$', re.I)
+
 class WRPCDynamicExtractor:
     def __init__(self):
         self.base_url = "https://www.wrpc.gov.in"
@@ -47,6 +57,22 @@ class WRPCDynamicExtractor:
         
         # FAST MODE: Enable by default for better performance
         self.fast_mode = True
+        
+        # In-process TTL cache of successful GETs (API payload, directory listings)
+        self._http_cache = {}
+        self._http_cache_ttl = 600
+
+    def _cached_get(self, url, timeout):
+        """GET a URL, reusing a successful response fetched within the TTL"""
+        now = time.monotonic()
+        entry = self._http_cache.get(url)
+        if entry is not None and now - entry[0] < self._http_cache_ttl:
+            logger.debug(f"♻️ Using cached response for {url}")
+            return entry[1]
+        response = self.session.get(url, timeout=timeout)
+        if response.status_code == 200:
+            self._http_cache[url] = (now, response)
+        return response
 
     def load_processed_weeks(self):
         """Load list of already processed weeks (no local storage)"""
@@ -64,16 +90,19 @@ class WRPCDynamicExtractor:
         """Get week information for the past 7 days"""
         try:
             today = datetime.now()
-            weeks = []
+            weeks = {}
             
             for i in range(7):
                 target_date = today - timedelta(days=i)
                 # Calculate week start (Monday) and end (Sunday)
                 days_since_monday = target_date.weekday()
                 week_start = target_date - timedelta(days=days_since_monday)
+                # 7 consecutive days span at most 2 weeks; format each week once
+                if week_start.date() in weeks:
+                    continue
                 week_end = week_start + timedelta(days=6)
                 
-                week_info = {
+                weeks[week_start.date()] = {
                     'start_date': week_start.strftime('%Y-%m-%d'),
                     'end_date': week_end.strftime('%Y-%m-%d'),
                     'start_ddmmyy': week_start.strftime('%d.%m.%y'),
@@ -81,9 +110,8 @@ class WRPCDynamicExtractor:
                     'week_num': week_start.isocalendar()[1],
                     'week_key': f"{week_start.strftime('%Y%m%d')}-{week_end.strftime('%Y%m%d')}"
                 }
-                weeks.append(week_info)
             
-            return weeks
+            return list(weeks.values())
         except Exception as e:
             logger.error(f"❌ Error calculating past 7 days weeks: {e}")
             return []
@@ -94,14 +122,14 @@ class WRPCDynamicExtractor:
             logger.info(f"🔍 FAST MODE: Parsing WRPC API content from: {self.api_url}")
             
             # Make request to the API endpoint with shorter timeout
-            response = self.session.get(self.api_url, timeout=8)  # Reduced timeout
+            response = self._cached_get(self.api_url, timeout=8)  # Reduced timeout
             if response.status_code != 200:
                 logger.error(f"❌ Failed to access API endpoint: {response.status_code}")
                 return None
             
             # Parse as JSON
             try:
-                data = response.json()
+                data = orjson.loads(response.content) if orjson is not None else response.json()
                 logger.info(f"✅ Successfully parsed JSON data")
                 
                 # Extract HTML content from the JSON response
@@ -139,39 +167,10 @@ class WRPCDynamicExtractor:
             logger.info(f"🔗 Found {len(links)} links in HTML")
             
             # Look for actual data files first (.zip, .xlsx, .csv) - prioritize ZIP files
-            data_links = []
-            for link in links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-                
-                # Look for actual data files (skip PDFs as they don't contain extractable data)
-                if any(ext in href.lower() for ext in ['.zip', '.xlsx', '.csv']):
-                    # Build full URL
-                    if href.startswith('http'):
-                        full_url = href
-                    elif href.startswith('//'):
-                        full_url = f"https:{href}"
-                    elif href.startswith('/'):
-                        full_url = f"{self.base_url}{href}"
-                    else:
-                        full_url = f"{self.base_url}/{href}"
-                    
-                    # Extract week information from filename
-                    week_info = self.extract_week_from_filename(href, text)
-                    
-                    data_links.append({
-                        'text': text,
-                        'url': full_url,
-                        'filename': os.path.basename(href),
-                        'week_info': week_info,
-                        'type': 'zip' if href.lower().endswith('.zip') else 'excel' if href.lower().endswith('.xlsx') else 'csv',
-                        'source': 'direct_file'
-                    })
-                    
-                    # Early stopping if we found enough files
-                    if len(data_links) >= 10:
-                        logger.info("🎯 Found 10 data files, stopping early")
-                        break
+            # Early stopping: islice stops pulling from the generator once we have 10 files
+            data_links = list(itertools.islice(self._iter_file_links(links), 10))
+            if len(data_links) >= 10:
+                logger.info("🎯 Found 10 data files, stopping early")
             
             # If no direct files found, look for data-related links
             if not data_links:
@@ -179,7 +178,9 @@ class WRPCDynamicExtractor:
                 
                 for link in links[:20]:  # Limit to first 20 links
                     href = link.get('href', '')
-                    text = link.get_text(strip=True).lower()
+                    # link.string is O(1) for the common single-text-child anchor
+                    raw_text = link.string.strip() if link.string is not None else link.get_text(strip=True)
+                    text = raw_text.lower()
                     
                     # Look for data-related keywords
                     if any(keyword in text for keyword in ['dsm', 'data', 'week', 'settlement', 'account', 'report', 'download']):
@@ -202,7 +203,7 @@ class WRPCDynamicExtractor:
                                 if any(ext in content_type.lower() for ext in ['zip', 'excel', 'csv', 'text']):
                                     week_info = self.extract_week_from_filename(href, text)
                                     data_links.append({
-                                        'text': link.get_text(strip=True),
+                                        'text': raw_text,
                                         'url': full_url,
                                         'filename': os.path.basename(href) or f"data_{len(data_links)}",
                                         'week_info': week_info,
@@ -230,6 +231,37 @@ class WRPCDynamicExtractor:
             logger.error(f"❌ Error extracting data from HTML: {e}")
             return None
 
+    def _iter_file_links(self, links):
+        """Lazily yield link dicts for anchors pointing at direct data files"""
+        for link in links:
+            href = link.get('href', '')
+            lower = href.lower()
+            if not any(ext in lower for ext in _FILE_EXTS):
+                continue
+            
+            # Only walk the anchor's subtree for links we keep
+            text = link.get_text(strip=True)
+            
+            # Build full URL
+            if href.startswith('http'):
+                full_url = href
+            elif href.startswith('//'):
+                full_url = f"https:{href}"
+            elif href.startswith('/'):
+                full_url = f"{self.base_url}{href}"
+            else:
+                full_url = f"{self.base_url}/{href}"
+            
+            yield {
+                'text': text,
+                'url': full_url,
+                'filename': os.path.basename(href),
+                # Extract week information from filename
+                'week_info': self.extract_week_from_filename(href, text),
+                'type': 'zip' if lower.endswith('.zip') else 'excel' if lower.endswith('.xlsx') else 'csv',
+                'source': 'direct_file'
+            }
+
     def extract_week_from_filename(self, filename, text):
         """Extract week information from filename or text"""
         try:
@@ -314,60 +346,69 @@ class WRPCDynamicExtractor:
             
             actual_files = []
             
-            for directory in common_dirs:
-                try:
-                    logger.info(f"🔍 Searching in: {directory}")
-                    response = self.session.get(directory, timeout=8)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Look for actual data files (.xlsx, .csv, .zip) - prioritize ZIP files
-                        file_links = soup.find_all('a', href=re.compile(r'\.(xlsx|csv|zip)$', re.I))
-                        
-                        # Sort links to prioritize ZIP files first
-                        zip_links = [link for link in file_links if link.get('href', '').lower().endswith('.zip')]
-                        other_links = [link for link in file_links if not link.get('href', '').lower().endswith('.zip')]
-                        sorted_links = zip_links + other_links
-                        
-                        for file_link in sorted_links:
-                            href = file_link.get('href', '')
-                            filename = file_link.get_text(strip=True)
-                            
-                            # Build full URL
-                            if href.startswith('http'):
-                                full_url = href
-                            elif href.startswith('//'):
-                                full_url = f"https:{href}"
-                            elif href.startswith('/'):
-                                full_url = f"{self.base_url}{href}"
-                            else:
-                                full_url = f"{directory.rstrip('/')}/{href}"
+            # Probe all directories concurrently; results are still consumed in priority order
+            executor = ThreadPoolExecutor(max_workers=len(common_dirs))
+            probes = [(directory, executor.submit(self._cached_get, directory, 8)) for directory in common_dirs]
+            
+            try:
+                for directory, probe in probes:
+                    try:
+                        logger.info(f"🔍 Searching in: {directory}")
+                        response = probe.result()
+                        if response.status_code == 200:
+                            soup = BeautifulSoup(response.text, 'html.parser')
                             
-                            # Extract week information from filename
-                            week_info = self.extract_week_from_filename(href, filename)
+                            # Look for actual data files (.xlsx, .csv, .zip) - prioritize ZIP files
+                            file_links = soup.find_all('a', href=_FILE_EXT_RE)
                             
-                            actual_files.append({
-                                'text': filename,
-                                'url': full_url,
-                                'filename': os.path.basename(href),
-                                'week_info': week_info,
-                                'type': 'zip' if href.lower().endswith('.zip') else 'excel' if href.lower().endswith('.xlsx') else 'csv',
-                                'source': 'actual_discovery'
-                            })
+                            # Sort links to prioritize ZIP files first (single pass)
+                            zip_links, other_links = [], []
+                            for link in file_links:
+                                (zip_links if link.get('href', '').lower().endswith('.zip') else other_links).append(link)
+                            sorted_links = zip_links + other_links
                             
-                            logger.info(f"✅ Found actual data file: {filename} -> {full_url}")
+                            for file_link in sorted_links:
+                                href = file_link.get('href', '')
+                                filename = file_link.get_text(strip=True)
+                                
+                                # Build full URL
+                                if href.startswith('http'):
+                                    full_url = href
+                                elif href.startswith('//'):
+                                    full_url = f"https:{href}"
+                                elif href.startswith('/'):
+                                    full_url = f"{self.base_url}{href}"
+                                else:
+                                    full_url = f"{directory.rstrip('/')}/{href}"
+                                
+                                # Extract week information from filename
+                                week_info = self.extract_week_from_filename(href, filename)
+                                
+                                actual_files.append({
+                                    'text': filename,
+                                    'url': full_url,
+                                    'filename': os.path.basename(href),
+                                    'week_info': week_info,
+                                    'type': 'zip' if href.lower().endswith('.zip') else 'excel' if href.lower().endswith('.xlsx') else 'csv',
+                                    'source': 'actual_discovery'
+                                })
+                                
+                                logger.info(f"✅ Found actual data file: {filename} -> {full_url}")
+                                
+                                # Early stopping if we found enough files
+                                if len(actual_files) >= 5:
+                                    logger.info(f"🎯 Found {len(actual_files)} actual data files, stopping search")
+                                    break
                             
-                            # Early stopping if we found enough files
                             if len(actual_files) >= 5:
-                                logger.info(f"🎯 Found {len(actual_files)} actual data files, stopping search")
                                 break
-                        
-                        if len(actual_files) >= 5:
-                            break
-                            
-                except Exception as e:
-                    logger.debug(f"⚠️ Could not search {directory}: {e}")
-                    continue
+                                
+                    except Exception as e:
+                        logger.debug(f"⚠️ Could not search {directory}: {e}")
+                        continue
+            finally:
+                # Don't wait on probes that are no longer needed (early stop or error)
+                executor.shutdown(wait=False, cancel_futures=True)
             
             if not actual_files:
                 logger.warning("⚠️ No actual data files found in any directories")
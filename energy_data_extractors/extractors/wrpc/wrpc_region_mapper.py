@@ -3,150 +3,228 @@ WRPC (Western Regional Power Committee) Region Mapper
 Maps Western Regional power stations to their respective states and regional groups
 """
 
+import bisect
+import functools
 import logging
 import json
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# WRPC station -> (state, regional group); shared read-only by all mappers
+_STATION_MAPPING: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    # Gujarat Stations
+    'GSECL': ('Gujarat', 'Western Coastal'),
+    'GUVNL': ('Gujarat', 'Western Coastal'),
+    'GPEC': ('Gujarat', 'Western Coastal'),
+    'GTPS': ('Gujarat', 'Western Coastal'),
+    'KLTPS': ('Gujarat', 'Western Coastal'),
+    'WCTPS': ('Gujarat', 'Western Coastal'),
+    'UNOSUGEN': ('Gujarat', 'Western Coastal'),
+    'KAWAS': ('Gujarat', 'Western Coastal'),
+    'GANDHAR': ('Gujarat', 'Western Coastal'),
+    'SABARMATI': ('Gujarat', 'Western Coastal'),
+    'ACBIL': ('Gujarat', 'Western Coastal'),
+
+    # Maharashtra Stations
+    'MAHAGENCO': ('Maharashtra', 'Western Plateau'),
+    'MSEDCL': ('Maharashtra', 'Western Plateau'),
+    'TATA POWER': ('Maharashtra', 'Western Plateau'),
+    'RELIANCE': ('Maharashtra', 'Western Plateau'),
+    'ADANI': ('Maharashtra', 'Western Plateau'),
+    'KORADI': ('Maharashtra', 'Western Plateau'),
+    'CHANDRAPUR': ('Maharashtra', 'Western Plateau'),
+    'NASHIK': ('Maharashtra', 'Western Plateau'),
+    'BHIRA': ('Maharashtra', 'Western Plateau'),
+    'TARAPUR': ('Maharashtra', 'Western Coastal'),
+    'MSPGCL': ('Maharashtra', 'Western Plateau'),
+
+    # Madhya Pradesh Stations
+    'MPPGCL': ('Madhya Pradesh', 'Central Plateau'),
+    'MPPMCL': ('Madhya Pradesh', 'Central Plateau'),
+    'SASAN': ('Madhya Pradesh', 'Central Plateau'),
+    'VINDHYACHAL': ('Madhya Pradesh', 'Central Plateau'),
+    'SATPURA': ('Madhya Pradesh', 'Central Plateau'),
+    'AMARKANTAK': ('Madhya Pradesh', 'Central Plateau'),
+    'SHREE SINGAJI': ('Madhya Pradesh', 'Central Plateau'),
+    'MPPTCL': ('Madhya Pradesh', 'Central Plateau'),
+
+    # Chhattisgarh Stations
+    'CSPDCL': ('Chhattisgarh', 'Central Plateau'),
+    'NTPC SIPAT': ('Chhattisgarh', 'Central Plateau'),
+    'KORBA': ('Chhattisgarh', 'Central Plateau'),
+    'BHILAI': ('Chhattisgarh', 'Central Plateau'),
+    'CSPTCL': ('Chhattisgarh', 'Central Plateau'),
+
+    # Rajasthan Stations
+    'RVUNL': ('Rajasthan', 'Western Desert'),
+    'RRVUNL': ('Rajasthan', 'Western Desert'),
+    'SURATGARH': ('Rajasthan', 'Western Desert'),
+    'CHHABRA': ('Rajasthan', 'Western Desert'),
+    'KALISINDH': ('Rajasthan', 'Western Desert'),
+    'BANSWARA': ('Rajasthan', 'Western Desert'),
+    'RSTPS': ('Rajasthan', 'Western Desert'),
+
+    # Goa Stations
+    'GEDA': ('Goa', 'Western Coastal'),
+
+    # Daman & Diu Stations
+    'DNH POWER': ('Daman & Diu', 'Western Coastal'),
+
+    # Multi-State Entities
+    'NTPC': ('Multi-State', 'Multi-State'),
+    'NHPC': ('Multi-State', 'Multi-State'),
+    'POWERGRID': ('Multi-State', 'Multi-State'),
+    'PGCIL': ('Multi-State', 'Multi-State'),
+})
+
+# Regional groups and their constituent states
+_STATE_GROUPS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Western Coastal': ('Gujarat', 'Maharashtra', 'Goa', 'Daman & Diu'),
+    'Western Plateau': ('Maharashtra',),
+    'Central Plateau': ('Madhya Pradesh', 'Chhattisgarh'),
+    'Western Desert': ('Rajasthan',),
+    'Multi-State': ('Multi-State',)
+})
+
+# Keyword fallback used when a station is neither a direct nor a partial match
+STATE_KEYWORDS = {
+    'Gujarat': ['GUJ', 'GUJARAT', 'GSECL', 'GUVNL', 'KAWAS', 'GANDHAR'],
+    'Maharashtra': ['MAH', 'MAHARASHTRA', 'MSEDCL', 'TATA', 'KORADI', 'CHANDRAPUR'],
+    'Madhya Pradesh': ['MP', 'MADHYA', 'PRADESH', 'MPPGCL', 'VINDHYACHAL', 'SATPURA'],
+    'Chhattisgarh': ['CG', 'CHHATTISGARH', 'CSPDCL', 'SIPAT', 'KORBA'],
+    'Rajasthan': ['RAJ', 'RAJASTHAN', 'RVUNL', 'SURATGARH', 'CHHABRA'],
+    'Goa': ['GOA', 'GEDA'],
+    'Multi-State': ['NTPC', 'NHPC', 'POWERGRID', 'PGCIL']
+}
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_cached(station_name: str) -> str:
+    # Strip first so upper() only copies the significant characters
+    return station_name.strip().upper()
+
+@functools.lru_cache(maxsize=None)
+def _build_partial_index(keys: Tuple[str, ...]):
+    """Precompute the structures used by WRPCRegionMapper._find_partial_match"""
+    # Character trie over the mapped stations; the None slot of a node
+    # holds the mapping-order rank of the key ending there.
+    trie = {}
+    for rank, key in enumerate(keys):
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, rank)
+    # Reverse direction (input contained in a key): search one
+    # separator-joined string and bisect the hit back to its key.
+    haystack = '\x00'.join(keys)
+    offsets = []
+    offset = 0
+    for key in keys:
+        offsets.append(offset)
+        offset += len(key) + 1
+    return trie, haystack, offsets
+
 class WRPCRegionMapper:
     """Maps WRPC power stations to their geographical regions and states"""
     
     def __init__(self):
-        self.station_mapping = self._initialize_station_mapping()
-        self.state_groups = self._initialize_state_groups()
-    
-    def _initialize_station_mapping(self) -> Dict[str, Dict[str, str]]:
-        """Initialize mapping of WRPC stations to states and regional groups"""
-        return {
-            # Gujarat Stations
-            'GSECL': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'GUVNL': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'GPEC': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'GTPS': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'KLTPS': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'WCTPS': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'UNOSUGEN': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'KAWAS': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'GANDHAR': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'SABARMATI': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            'ACBIL': {'state': 'Gujarat', 'group': 'Western Coastal'},
-            
-            # Maharashtra Stations
-            'MAHAGENCO': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'MSEDCL': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'TATA POWER': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'RELIANCE': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'ADANI': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'KORADI': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'CHANDRAPUR': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'NASHIK': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'BHIRA': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            'TARAPUR': {'state': 'Maharashtra', 'group': 'Western Coastal'},
-            'MSPGCL': {'state': 'Maharashtra', 'group': 'Western Plateau'},
-            
-            # Madhya Pradesh Stations
-            'MPPGCL': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'MPPMCL': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'SASAN': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'VINDHYACHAL': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'SATPURA': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'AMARKANTAK': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'SHREE SINGAJI': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            'MPPTCL': {'state': 'Madhya Pradesh', 'group': 'Central Plateau'},
-            
-            # Chhattisgarh Stations
-            'CSPDCL': {'state': 'Chhattisgarh', 'group': 'Central Plateau'},
-            'NTPC SIPAT': {'state': 'Chhattisgarh', 'group': 'Central Plateau'},
-            'KORBA': {'state': 'Chhattisgarh', 'group': 'Central Plateau'},
-            'BHILAI': {'state': 'Chhattisgarh', 'group': 'Central Plateau'},
-            'CSPTCL': {'state': 'Chhattisgarh', 'group': 'Central Plateau'},
-            
-            # Rajasthan Stations
-            'RVUNL': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            'RRVUNL': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            'SURATGARH': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            'CHHABRA': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            'KALISINDH': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            'BANSWARA': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            'RSTPS': {'state': 'Rajasthan', 'group': 'Western Desert'},
-            
-            # Goa Stations
-            'GEDA': {'state': 'Goa', 'group': 'Western Coastal'},
-            
-            # Daman & Diu Stations
-            'DNH POWER': {'state': 'Daman & Diu', 'group': 'Western Coastal'},
-            
-            # Multi-State Entities
-            'NTPC': {'state': 'Multi-State', 'group': 'Multi-State'},
-            'NHPC': {'state': 'Multi-State', 'group': 'Multi-State'},
-            'POWERGRID': {'state': 'Multi-State', 'group': 'Multi-State'},
-            'PGCIL': {'state': 'Multi-State', 'group': 'Multi-State'},
-        }
-    
-    def _initialize_state_groups(self) -> Dict[str, List[str]]:
-        """Initialize regional groups and their constituent states"""
-        return {
-            'Western Coastal': ['Gujarat', 'Maharashtra', 'Goa', 'Daman & Diu'],
-            'Western Plateau': ['Maharashtra'],
-            'Central Plateau': ['Madhya Pradesh', 'Chhattisgarh'],
-            'Western Desert': ['Rajasthan'],
-            'Multi-State': ['Multi-State']
-        }
+        self.station_mapping = _STATION_MAPPING
+        self.state_groups = _STATE_GROUPS
+        # state -> group; a state listed under several groups resolves to the
+        # first one (Maharashtra -> 'Western Coastal'), as the old scan did
+        self._group_for_state = {}
+        for group, states in self.state_groups.items():
+            for state in states:
+                self._group_for_state.setdefault(state, group)
+        # Flattened (keyword, state, group) list, in STATE_KEYWORDS order
+        self._keyword_index = [(keyword, state, self._get_group_for_state(state))
+                               for state, keywords in STATE_KEYWORDS.items()
+                               for keyword in keywords]
+        self._partial_keys = tuple(self.station_mapping)
+        self._partial_trie, self._partial_haystack, self._partial_offsets = \
+            _build_partial_index(self._partial_keys)
+        # Length bounds let _find_partial_match skip a direction outright
+        self._min_substr_len = min(map(len, self._partial_keys), default=1)
+        self._max_substr_len = max(map(len, self._partial_keys), default=0)
+        # Station names repeat heavily across records; memoize on the normalized name
+        self._map_cached = functools.lru_cache(maxsize=4096)(self._map_station_impl)
     
     def normalize_station_name(self, station_name: str) -> str:
         """Normalize station name for matching"""
         if not station_name:
             return ""
-        return station_name.upper().strip()
+        return _normalize_cached(station_name)
     
     def map_station_to_region(self, station_name: str) -> Tuple[str, str]:
         """Map a station name to its state and regional group"""
-        try:
-            normalized_name = self.normalize_station_name(station_name)
-            
-            # Direct mapping
-            if normalized_name in self.station_mapping:
-                mapping = self.station_mapping[normalized_name]
-                return mapping['state'], mapping['group']
-            
-            # Partial matching for complex station names
-            for mapped_station, mapping in self.station_mapping.items():
-                if mapped_station in normalized_name or normalized_name in mapped_station:
-                    logger.info(f"🔍 Partial match found: {station_name} -> {mapped_station}")
-                    return mapping['state'], mapping['group']
-            
-            # Keyword-based fallback matching
-            state_keywords = {
-                'Gujarat': ['GUJ', 'GUJARAT', 'GSECL', 'GUVNL', 'KAWAS', 'GANDHAR'],
-                'Maharashtra': ['MAH', 'MAHARASHTRA', 'MSEDCL', 'TATA', 'KORADI', 'CHANDRAPUR'],
-                'Madhya Pradesh': ['MP', 'MADHYA', 'PRADESH', 'MPPGCL', 'VINDHYACHAL', 'SATPURA'],
-                'Chhattisgarh': ['CG', 'CHHATTISGARH', 'CSPDCL', 'SIPAT', 'KORBA'],
-                'Rajasthan': ['RAJ', 'RAJASTHAN', 'RVUNL', 'SURATGARH', 'CHHABRA'],
-                'Goa': ['GOA', 'GEDA'],
-                'Multi-State': ['NTPC', 'NHPC', 'POWERGRID', 'PGCIL']
-            }
-            
-            for state, keywords in state_keywords.items():
-                if any(keyword in normalized_name for keyword in keywords):
-                    group = self._get_group_for_state(state)
-                    logger.info(f"🔍 Keyword match found: {station_name} -> {state} ({group})")
-                    return state, group
-            
-            # Unknown station
-            logger.warning(f"⚠️ Unknown WRPC station: {station_name}")
-            return 'Unknown', 'Unknown'
-            
-        except Exception as e:
-            logger.error(f"❌ Error mapping station {station_name}: {e}")
+        if not isinstance(station_name, str):
+            logger.warning(f"⚠️ Unknown WRPC station: {station_name!r}")
             return 'Unknown', 'Unknown'
+        
+        # Fast path: already-canonical names skip normalization entirely
+        hit = self.station_mapping.get(station_name)
+        if hit is not None:
+            return hit
+        return self._map_cached(self.normalize_station_name(station_name))
+    
+    def _map_station_impl(self, normalized_name: str) -> Tuple[str, str]:
+        """Resolve an already-normalized station name (memoized via _map_cached)"""
+        # Direct mapping
+        hit = self.station_mapping.get(normalized_name)
+        if hit is not None:
+            return hit
+        
+        # Partial matching for complex station names
+        mapped_station = self._find_partial_match(normalized_name)
+        if mapped_station is not None:
+            logger.info(f"🔍 Partial match found: {normalized_name} -> {mapped_station}")
+            return self.station_mapping[mapped_station]
+        
+        # Keyword-based fallback matching
+        for keyword, state, group in self._keyword_index:
+            if keyword in normalized_name:
+                logger.info(f"🔍 Keyword match found: {normalized_name} -> {state} ({group})")
+                return state, group
+        
+        # Unknown station
+        logger.warning(f"⚠️ Unknown WRPC station: {normalized_name}")
+        return 'Unknown', 'Unknown'
+    
+    def _find_partial_match(self, normalized_name: str) -> Optional[str]:
+        """Return the first mapped station (in mapping order) that contains or
+        is contained in normalized_name, or None"""
+        best = len(self._partial_keys)
+        
+        # Mapped station contained in the name: walk the trie from each offset
+        # (impossible when the name is shorter than every key)
+        length = len(normalized_name)
+        for start in range(length - self._min_substr_len + 1):
+            node = self._partial_trie.get(normalized_name[start])
+            pos = start + 1
+            while node is not None:
+                rank = node.get(None)
+                if rank is not None and rank < best:
+                    best = rank
+                if pos == length:
+                    break
+                node = node.get(normalized_name[pos])
+                pos += 1
+        
+        # Name contained in a mapped station (impossible when it is longer)
+        if length <= self._max_substr_len and '\x00' not in normalized_name:
+            pos = self._partial_haystack.find(normalized_name)
+            if pos != -1:
+                rank = bisect.bisect_right(self._partial_offsets, pos) - 1
+                if rank < best:
+                    best = rank
+        
+        return self._partial_keys[best] if best < len(self._partial_keys) else None
     
     def _get_group_for_state(self, state: str) -> str:
         """Get regional group for a given state"""
-        for group, states in self.state_groups.items():
-            if state in states:
-                return group
-        return 'Unknown'
+        return self._group_for_state.get(state, 'Unknown')
     
     def get_all_stations(self) -> List[str]:
         """Get list of all mapped stations"""
@@ -154,48 +232,41 @@ class WRPCRegionMapper:
     
     def get_states_in_group(self, group: str) -> List[str]:
         """Get all states in a regional group"""
-        return self.state_groups.get(group, [])
+        return list(self.state_groups.get(group, ()))
     
     def get_stations_by_state(self, state: str) -> List[str]:
         """Get all stations in a specific state"""
-        return [station for station, mapping in self.station_mapping.items() 
-                if mapping['state'] == state]
+        return [station for station, (station_state, _) in self.station_mapping.items() 
+                if station_state == state]
     
     def get_stations_by_group(self, group: str) -> List[str]:
         """Get all stations in a specific regional group"""
-        return [station for station, mapping in self.station_mapping.items() 
-                if mapping['group'] == group]
+        return [station for station, (_, station_group) in self.station_mapping.items() 
+                if station_group == group]
     
     def generate_summary(self, station_counts: Dict[str, int]) -> Dict:
         """Generate a summary of regional distribution"""
         try:
-            state_distribution = {}
-            group_distribution = {}
-            total_stations = 0
+            total_stations = sum(station_counts.values())
             
+            # One update per station, keyed on the resolved (state, group) pair
+            pair_distribution = defaultdict(int)
             for station, count in station_counts.items():
-                state, group = self.map_station_to_region(station)
-                
-                # Update state distribution
-                if state in state_distribution:
-                    state_distribution[state] += count
-                else:
-                    state_distribution[state] = count
-                
-                # Update group distribution
-                if group in group_distribution:
-                    group_distribution[group] += count
-                else:
-                    group_distribution[group] = count
-                
-                total_stations += count
+                pair_distribution[self.map_station_to_region(station)] += count
+            
+            # Fold the (small) pair table into the two distributions
+            state_distribution = defaultdict(int)
+            group_distribution = defaultdict(int)
+            for (state, group), count in pair_distribution.items():
+                state_distribution[state] += count
+                group_distribution[group] += count
             
             return {
                 'total_stations': len(station_counts),
                 'states_covered': len(state_distribution),
                 'regional_groups': len(group_distribution),
-                'state_distribution': state_distribution,
-                'group_distribution': group_distribution,
+                'state_distribution': dict(state_distribution),
+                'group_distribution': dict(group_distribution),
                 'total_records': total_stations
             }
             
@@ -9,17 +9,26 @@ Reuploads all data with the correct S3 path structure:
 import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Make region extractors importable from any working directory. Extractors run
+# concurrently below, so the process-wide os.chdir() approach is not an option.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+EXTRACTORS_DIR = os.path.join(BASE_DIR, 'extractors')
+for region_dir in ['nerpc', 'nrldc', 'erldc', 'srpc', 'wrpc']:
+    region_path = os.path.join(EXTRACTORS_DIR, region_dir)
+    if region_path not in sys.path:
+        sys.path.append(region_path)
+
 def run_nerpc():
     """Run NERPC extractor with corrected paths"""
     try:
         logger.info("🚀 Starting NERPC reupload with corrected paths...")
-        os.chdir("extractors/nerpc")
         
         from nerpc_extractor import NERPCDynamicExtractor
         extractor = NERPCDynamicExtractor()
@@ -28,18 +37,15 @@ def run_nerpc():
         result = extractor.run_extraction()
         logger.info(f"✅ NERPC reupload completed: {result}")
         
-        os.chdir("../..")
         return True
     except Exception as e:
         logger.error(f"❌ NERPC reupload failed: {e}")
-        os.chdir("../..")
         return False
 
 def run_wrpc():
     """Run WRPC extractor with corrected paths"""
     try:
         logger.info("🚀 Starting WRPC reupload with corrected paths...")
-        os.chdir("extractors/wrpc")
         
         from wrpc_extractor import WRPCDynamicExtractor
         extractor = WRPCDynamicExtractor()
@@ -48,18 +54,15 @@ def run_wrpc():
         result = extractor.run_extraction()
         logger.info(f"✅ WRPC reupload completed: {result}")
         
-        os.chdir("../..")
         return True
     except Exception as e:
         logger.error(f"❌ WRPC reupload failed: {e}")
-        os.chdir("../..")
         return False
 
 def run_erldc():
     """Run ERLDC extractor with corrected paths"""
     try:
         logger.info("🚀 Starting ERLDC reupload with corrected paths...")
-        os.chdir("extractors/erldc")
         
         from erldc_extractor import ERLDCDynamicExtractor
         extractor = ERLDCDynamicExtractor()
@@ -68,18 +71,15 @@ def run_erldc():
         result = extractor.run_extraction()
         logger.info(f"✅ ERLDC reupload completed: {result}")
         
-        os.chdir("../..")
         return True
     except Exception as e:
         logger.error(f"❌ ERLDC reupload failed: {e}")
-        os.chdir("../..")
         return False
 
 def run_srpc():
     """Run SRPC extractor with corrected paths"""
     try:
         logger.info("🚀 Starting SRPC reupload with corrected paths...")
-        os.chdir("extractors/srpc")
         
         from srpc_extractor import SRPCExtractor
         extractor = SRPCExtractor()
@@ -88,18 +88,15 @@ def run_srpc():
         result = extractor.discover_last_7_days()
         logger.info(f"✅ SRPC reupload completed: {result}")
         
-        os.chdir("../..")
         return True
     except Exception as e:
         logger.error(f"❌ SRPC reupload failed: {e}")
-        os.chdir("../..")
         return False
 
 def run_nrldc():
     """Run NRLDC extractor with corrected paths"""
     try:
         logger.info("🚀 Starting NRLDC reupload with corrected paths...")
-        os.chdir("extractors/nrldc")
         
         from nrldc_extractor import NRLDCWorkingDSAExtractor
         extractor = NRLDCWorkingDSAExtractor()
@@ -108,11 +105,9 @@ def run_nrldc():
         result = extractor.run_extraction()
         logger.info(f"✅ NRLDC reupload completed: {result}")
         
-        os.chdir("../..")
         return True
     except Exception as e:
         logger.error(f"❌ NRLDC reupload failed: {e}")
-        os.chdir("../..")
         return False
 
 def main():
@@ -136,14 +131,20 @@ def main():
         ("NRLDC", run_nrldc)
     ]
     
-    for region, func in extractors:
-        print(f"\n{'='*20} {region} {'='*20}")
-        try:
-            success = func()
-            results[region] = "✅ SUCCESS" if success else "❌ FAILED"
-        except Exception as e:
-            logger.error(f"❌ {region} failed with exception: {e}")
-            results[region] = "❌ EXCEPTION"
+    # Each reupload is an independent, network-bound job; run them side by side
+    with ThreadPoolExecutor(max_workers=len(extractors)) as executor:
+        futures = []
+        for region, func in extractors:
+            print(f"\n{'='*20} {region} {'='*20}")
+            futures.append((region, executor.submit(func)))
+        
+        for region, future in futures:
+            try:
+                success = future.result()
+                results[region] = "✅ SUCCESS" if success else "❌ FAILED"
+            except Exception as e:
+                logger.error(f"❌ {region} failed with exception: {e}")
+                results[region] = "❌ EXCEPTION"
     
     # Summary
     end_time = datetime.now()
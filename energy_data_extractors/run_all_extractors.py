@@ -2,15 +2,20 @@
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Ensure imports work when running from repo root
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 EXTRACTORS_DIR = os.path.join(BASE_DIR, 'extractors')
-sys.path.append(EXTRACTORS_DIR)
 
-# Add each region subdirectory to sys.path for region helper imports
-for region_dir in ['nerpc', 'nrldc', 'erldc', 'srpc', 'wrpc']:
-    sys.path.append(os.path.join(EXTRACTORS_DIR, region_dir))
+# Add extractors/ and each region subdirectory to sys.path for region helper
+# imports, skipping entries already present (e.g. when this module is re-imported)
+_seen_paths = set(sys.path)
+for path in [EXTRACTORS_DIR] + [os.path.join(EXTRACTORS_DIR, region_dir)
+                                for region_dir in ['nerpc', 'nrldc', 'erldc', 'srpc', 'wrpc']]:
+    if path not in _seen_paths:
+        sys.path.append(path)
+        _seen_paths.add(path)
 
 # Region-specific imports
 from nerpc_extractor import NERPCDynamicExtractor  # in extractors/nerpc
@@ -49,6 +54,8 @@ def main():
     parser = argparse.ArgumentParser(description='Run DSM extractors by region')
     parser.add_argument('--regions', nargs='*', default=['ALL'],
                         help='Regions to run: NERPC, NRLDC, ERLDC, SRPC, WRPC or ALL')
+    parser.add_argument('--workers', type=int, default=5,
+                        help='Extractors to run concurrently (1 = sequential)')
     args = parser.parse_args()
 
     selected = [r.upper() for r in args.regions]
@@ -63,23 +70,33 @@ def main():
         'WRPC': run_wrpc,
     }
 
-    summary = {}
+    to_run = []
     for region in selected:
         if region not in runners:
             print(f"Skipping unknown region: {region}")
             continue
-        print(f"\n=== Running {region} extractor ===")
-        try:
-            result = runners[region]()
-            summary[region] = 'ok'
-            print(f"=== {region} completed ===")
-        except Exception as e:
-            summary[region] = f"error: {e}"
-            print(f"ERROR in {region}: {e}")
+        to_run.append(region)
+
+    # Extractors are independent, network-bound jobs; run them side by side
+    summary = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(to_run) or 1))) as executor:
+        futures = {}
+        for region in to_run:
+            print(f"\n=== Running {region} extractor ===")
+            futures[executor.submit(runners[region])] = region
+        for future in as_completed(futures):
+            region = futures[future]
+            try:
+                future.result()
+                summary[region] = 'ok'
+                print(f"=== {region} completed ===")
+            except Exception as e:
+                summary[region] = f"error: {e}"
+                print(f"ERROR in {region}: {e}")
 
     print("\nSummary:")
-    for k, v in summary.items():
-        print(f"- {k}: {v}")
+    for region in to_run:
+        print(f"- {region}: {summary[region]}")
 
 
 if __name__ == '__main__':
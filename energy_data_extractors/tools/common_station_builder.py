@@ -1,85 +1,360 @@
 #!/usr/bin/env python3
 import os
 import re
+import csv
 import json
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
+logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+# Low-cardinality labels; dictionary-encoded (pandas: category) before any concat
+CATEGORY_COLUMNS = ('Region', 'Data_Source', 'Station_Name', 'Origin')
+# Dtype hints. Arrow would infer ISO dates/times as temporal types; pd.read_csv kept
+# them as text. Labels are decoded straight into dictionaries instead of a full string column.
+_TEXT_COLUMNS = {
+    'Date': pa.string(), 'Time': pa.string(), 'Processing_Date': pa.string(),
+    **{c: pa.dictionary(pa.int32(), pa.string()) for c in CATEGORY_COLUMNS},
+}
+_CONVERT_OPTIONS = pacsv.ConvertOptions(column_types=_TEXT_COLUMNS, strings_can_be_null=True)
+# Station/region/source strings repeat on every row; dictionary pages + zstd shrink them
+PARQUET_WRITE_OPTIONS = {'compression': 'zstd', 'compression_level': 3, 'use_dictionary': True}
+
+
+def emit_csv() -> bool:
+    """CSV copies of the station files are opt-in (EMIT_CSV=1); Parquet is always written."""
+    return os.getenv('EMIT_CSV') == '1'
+
+
+@lru_cache(maxsize=4096)
 def canonicalize_station_name(name: str) -> str:
     if name is None:
         return ''
     s = str(name).strip()
     s = s.replace('/', '_').replace('\\', '_')
-    s = re.sub(r"\s+", "_", s)
+    s = _WS_RE.sub("_", s)
     return s.upper()
 
 
-def drop_unnamed(df: pd.DataFrame) -> pd.DataFrame:
-    return df.loc[:, ~df.columns.str.startswith('Unnamed')]
-
-
-def normalize_columns(df: pd.DataFrame, source: str) -> pd.DataFrame:
-    mapping: Dict[str, str] = {
-        # common
-        'Date': 'Date',
-        'Time': 'Time',
-        'Block': 'Block',
-        'Station_Name': 'Station_Name',
-        'Processing_Date': 'Processing_Date',
-        'Region': 'Region',
-        'Sheet_Name': 'Sheet_Name',
-        'Source_File': 'Source_File',
-        # frequency
-        'Freq(Hz)': 'Freq_Hz',
-        'Freq (Hz)': 'Freq_Hz',
-        # energy
-        'Actual (MWH)': 'Actual_MWh',
-        'Schedule (MWH)': 'Schedule_MWh',
-        'SRAS (MWH)': 'SRAS_MWh',
-        'Deviation(MWH)': 'Deviation_MWh',
-        'Deviation (MWH)': 'Deviation_MWh',
-        'Deviation (%)': 'Deviation_Pct',
-        'DSM Payable (Rs.)': 'DSM_Payable_Rs',
-        'DSM Receivable (Rs.)': 'DSM_Receivable_Rs',
-        # rates
-        'Normal Rate (p/Kwh)': 'Normal_Rate_p_per_kWh',
-        'Normal DSM Rate \nApplicable (p/KWH)': 'Normal_Rate_p_per_kWh',
-        'Reference DSM Rate \\n+Applicable (p/KWH)': 'Reference_DSM_Rate_p_per_kWh',
-        'Wt. Avg. Hybrid Rate (p/Kwh)': 'Wt_Avg_Hybrid_Rate_p_per_kWh',
-        'Wt.Avg. DSM Rate (Hybrid Gen) \\n+Applicable (p/KWH)': 'Wt_Avg_Hybrid_Rate_p_per_kWh',
-        'Variable DSM Rate (ISGS) \nApplicable (p/KWH)': 'Variable_DSM_Rate_ISGS_p_per_kWh',
-        'Contract Rate (RE Gen) \nApplicable (Rs./MWH)': 'Contract_Rate_RE_Rs_per_MWh',
-        # wrpc-specific
-        'HPDAM Ref. Rate (p/Kwh)': 'HPDAM_Ref_Rate_p_per_kWh',
-        'HPDAM Normal Rate (p/Kwh)': 'HPDAM_Normal_Rate_p_per_kWh',
-        'Constituents': 'Constituents',
-    }
-
-    # Apply mapping where possible
-    new_cols: List[str] = []
-    for c in df.columns:
-        if c in mapping:
-            new_cols.append(mapping[c])
-        else:
-            # sanitize exotic whitespace to compare
-            c_norm = c.replace('\r', '').replace('\n', ' ').strip()
-            found = None
-            for k, v in mapping.items():
-                k_norm = k.replace('\\n', ' ').replace('\n', ' ').strip()
-                if c_norm == k_norm:
-                    found = v
-                    break
-            new_cols.append(found if found else c)
-    df.columns = new_cols
+def drop_unnamed(table: pa.Table) -> pa.Table:
+    keep = [c for c in table.column_names if not c.startswith('Unnamed')]
+    # read_csv_table already prunes these, so usually there is nothing to drop
+    return table if len(keep) == table.num_columns else table.select(keep)
+
+
+def _pandas_column_names(names: List[str]) -> List[str]:
+    """Name blank and repeated headers the way pd.read_csv does (Unnamed: i, X.1)."""
+    out: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, name in enumerate(names):
+        name = name or f'Unnamed: {i}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        seen.setdefault(name, 0)
+        out.append(name)
+    return out
+
+
+def set_column(table: pa.Table, name: str, values: pa.Array) -> pa.Table:
+    """Replace column ``name`` or append it, like ``df[name] = values``."""
+    if name in table.column_names:
+        return table.set_column(table.column_names.index(name), name, values)
+    return table.append_column(name, values)
+
+
+def constant_column(value: str, length: int) -> pa.DictionaryArray:
+    """A column repeating ``value``: one dictionary entry plus int8 zero codes.
+
+    Stamping Region/Data_Source/Station_Name per file this way costs a byte per
+    row instead of a full string column that encode_categories would re-hash.
+    """
+    return pa.DictionaryArray.from_arrays(pa.repeat(pa.scalar(0, pa.int8()), length), pa.array([value]))
+
+
+def encode_categories(table: pa.Table) -> pa.Table:
+    """Dictionary-encode the CATEGORY_COLUMNS present in ``table`` as text."""
+    for i, f in enumerate(table.schema):
+        if f.name in CATEGORY_COLUMNS and (pa.types.is_string(f.type) or pa.types.is_large_string(f.type)):
+            table = table.set_column(i, f.name, pc.dictionary_encode(table.column(i)))
+    return table
+
+
+def _clashing_columns(schemas: List[pa.Schema]) -> set:
+    """Columns whose types cannot be promoted to a common type (e.g. int64 vs string)."""
+    types: Dict[str, set] = {}
+    for schema in schemas:
+        for f in schema:
+            types.setdefault(f.name, set()).add(f.type)
+    clashing = set()
+    for name, seen in types.items():
+        try:
+            pa.unify_schemas([pa.schema([(name, t)]) for t in seen], promote_options='permissive')
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            clashing.add(name)
+    return clashing
+
+
+def unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """Union of ``schemas`` with the same promotion rules as concat_tables."""
+    try:
+        return pa.unify_schemas(schemas, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    clashing = _clashing_columns(schemas)
+    widened = [pa.schema([pa.field(f.name, pa.string()) if f.name in clashing else f for f in schema])
+               for schema in schemas]
+    return pa.unify_schemas(widened, promote_options='permissive')
+
+
+def concat_tables(tables: List[pa.Table]) -> pa.Table:
+    """Concatenate without copying, unioning columns like pd.concat(sort=False).
+
+    Numeric types widen and missing columns fill with nulls; a column that is
+    text in one file and numeric in another is cast to string first, which is
+    what the old object-dtype concat ended up writing.
+    """
+    try:
+        return pa.concat_tables(tables, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    clashing = _clashing_columns([t.schema for t in tables])
+    recast = []
+    for t in tables:
+        for i, f in enumerate(t.schema):
+            if f.name in clashing and f.type != pa.string():
+                t = t.set_column(i, f.name, t.column(i).cast(pa.string()))
+        recast.append(t)
+    return pa.concat_tables(recast, promote_options='permissive')
+
+
+def align_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast ``table`` to ``schema``, filling columns it lacks with nulls."""
+    names = set(table.column_names)
+    return pa.Table.from_arrays(
+        [table.column(f.name).cast(f.type) if f.name in names else pa.nulls(table.num_rows, f.type)
+         for f in schema],
+        schema=schema)
+
+
+def read_csv_table(csv_path: Path) -> pa.Table:
+    """Read a CSV with Arrow's multithreaded parser, falling back to pandas.
+
+    Arrow infers column types from the first block and rejects files whose later
+    rows disagree; those still go through pd.read_csv so no file is lost.
+    """
+    # Every caller drops Unnamed/blank-header columns, so don't parse them at all
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        header = next(csv.reader(f), [])
+    keep = [c for c in header if c and not c.startswith('Unnamed')]
+    convert_options = _CONVERT_OPTIONS
+    if len(keep) < len(header) and len(set(keep)) == len(keep):
+        convert_options = pacsv.ConvertOptions(
+            column_types=_TEXT_COLUMNS, strings_can_be_null=True, include_columns=keep)
+    try:
+        table = pacsv.read_csv(csv_path, read_options=_READ_OPTIONS, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        df = pd.read_csv(csv_path, low_memory=False, usecols=lambda c: not str(c).startswith('Unnamed'))
+        mixed = df.select_dtypes(include='object').columns
+        if len(mixed):
+            df = df.astype({c: 'string' for c in mixed})
+        return pa.Table.from_pandas(df, preserve_index=False)
+    # Arrow infers ISO dates/times as temporal types; pd.read_csv kept them as text.
+    # Casting back would respell values ("00:15" -> "00:15:00"), and Arrow has no
+    # switch for date/time inference, so re-read with those columns typed as text.
+    temporal = {f.name: pa.string() for f in table.schema if pa.types.is_temporal(f.type)}
+    if temporal:
+        table = pacsv.read_csv(csv_path, read_options=_READ_OPTIONS, convert_options=pacsv.ConvertOptions(
+            column_types={**convert_options.column_types, **temporal}, strings_can_be_null=True,
+            include_columns=convert_options.include_columns))
+    return table.rename_columns(_pandas_column_names(table.column_names))
+
+
+class KnownBadCsv(Exception):
+    """The CSV failed to parse on an earlier run and has not changed since."""
+
+
+# Malformed content: fails the same way every time, so it is remembered until the file changes
+PARSE_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pd.errors.ParserError, pd.errors.EmptyDataError,
+                UnicodeDecodeError)
+# What an unreadable or malformed source CSV raises; anything else is a bug and propagates.
+# OSError (permissions, EMFILE, flaky mounts) is skipped for this run only.
+READ_ERRORS = (KnownBadCsv, pa.ArrowException, OSError) + PARSE_ERRORS
+
+
+class ParsedCsvCache:
+    """Parquet copies of parsed source CSVs, reused while the CSV is unchanged.
+
+    ``.manifest.json`` maps each CSV path to its ``version:mtime_ns:size`` signature and
+    the cached file under ``.cache/``. A changed signature re-parses the CSV and
+    overwrites that path's entry, so the cache never holds more than one copy
+    per source file. CSVs whose content fails to parse are recorded with their
+    error instead and raise KnownBadCsv until they change; OS-level read
+    failures are not recorded. Safe to share across ingest threads.
+    """
+
+    # Bump whenever read_csv_table's output changes, so older cached tables are re-parsed
+    READER_VERSION = 2
+
+    def __init__(self, root: Path):
+        self.cache_dir = root / '.cache'
+        self.manifest_path = root / '.manifest.json'
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest: Dict[str, Dict[str, str]] = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def _signature(self, st: os.stat_result) -> str:
+        return f"{self.READER_VERSION}:{st.st_mtime_ns}:{st.st_size}"
+
+    def read(self, csv_path: Path) -> pa.Table:
+        st = csv_path.stat()
+        path_key = str(csv_path.resolve())
+        signature = self._signature(st)
+        entry = self.manifest.get(path_key)
+        if entry and entry.get('signature') == signature:
+            if 'error' in entry:
+                raise KnownBadCsv(entry['error'])
+            try:
+                return pq.read_table(self.cache_dir / entry['cache'])
+            except (OSError, pa.ArrowException):
+                pass  # cache file gone or truncated; re-parse below
+        try:
+            table = read_csv_table(csv_path)
+        except PARSE_ERRORS as e:
+            with self._lock:
+                self.manifest[path_key] = {'signature': signature, 'error': f"{type(e).__name__}: {e}"}
+                self._dirty = True
+            raise
+        cache_file = self.cache_dir / f"{hashlib.sha1(path_key.encode()).hexdigest()}.parquet"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, cache_file)
+        except (OSError, pa.ArrowException):
+            return table
+        with self._lock:
+            self.manifest[path_key] = {'signature': signature, 'cache': cache_file.name}
+            self._dirty = True
+        return table
+
+    def read_schema(self, csv_path: Path) -> pa.Schema:
+        """Schema of ``read(csv_path)``; a cache hit only touches the Parquet footer."""
+        st = csv_path.stat()
+        entry = self.manifest.get(str(csv_path.resolve()))
+        if entry and entry.get('signature') == self._signature(st) and 'cache' in entry:
+            try:
+                return pq.read_schema(self.cache_dir / entry['cache'])
+            except (OSError, pa.ArrowException):
+                pass
+        return self.read(csv_path).schema
+
+    def save(self) -> None:
+        """Persist the manifest atomically (temp file + os.replace)."""
+        if not self._dirty:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        self._dirty = False
+
+
+_COLUMN_MAPPING: Dict[str, str] = {
+    # common
+    'Date': 'Date',
+    'Time': 'Time',
+    'Block': 'Block',
+    'Station_Name': 'Station_Name',
+    'Processing_Date': 'Processing_Date',
+    'Region': 'Region',
+    'Sheet_Name': 'Sheet_Name',
+    'Source_File': 'Source_File',
+    # frequency
+    'Freq(Hz)': 'Freq_Hz',
+    'Freq (Hz)': 'Freq_Hz',
+    # energy
+    'Actual (MWH)': 'Actual_MWh',
+    'Schedule (MWH)': 'Schedule_MWh',
+    'SRAS (MWH)': 'SRAS_MWh',
+    'Deviation(MWH)': 'Deviation_MWh',
+    'Deviation (MWH)': 'Deviation_MWh',
+    'Deviation (%)': 'Deviation_Pct',
+    'DSM Payable (Rs.)': 'DSM_Payable_Rs',
+    'DSM Receivable (Rs.)': 'DSM_Receivable_Rs',
+    # rates
+    'Normal Rate (p/Kwh)': 'Normal_Rate_p_per_kWh',
+    'Normal DSM Rate \nApplicable (p/KWH)': 'Normal_Rate_p_per_kWh',
+    'Reference DSM Rate \\n+Applicable (p/KWH)': 'Reference_DSM_Rate_p_per_kWh',
+    'Wt. Avg. Hybrid Rate (p/Kwh)': 'Wt_Avg_Hybrid_Rate_p_per_kWh',
+    'Wt.Avg. DSM Rate (Hybrid Gen) \\n+Applicable (p/KWH)': 'Wt_Avg_Hybrid_Rate_p_per_kWh',
+    'Variable DSM Rate (ISGS) \nApplicable (p/KWH)': 'Variable_DSM_Rate_ISGS_p_per_kWh',
+    'Contract Rate (RE Gen) \nApplicable (Rs./MWH)': 'Contract_Rate_RE_Rs_per_MWh',
+    # wrpc-specific
+    'HPDAM Ref. Rate (p/Kwh)': 'HPDAM_Ref_Rate_p_per_kWh',
+    'HPDAM Normal Rate (p/Kwh)': 'HPDAM_Normal_Rate_p_per_kWh',
+    'Constituents': 'Constituents',
+}
+
+# Same keys with escaped/real newlines folded to spaces; reversed so the first key wins on collisions
+_NORMALIZED_MAPPING: Dict[str, str] = {
+    k.replace('\\n', ' ').replace('\n', ' ').strip(): v for k, v in reversed(_COLUMN_MAPPING.items())
+}
+
+
+def normalize_columns(table: pa.Table, source: str) -> pa.Table:
+    # Apply mapping where possible, then retry on the whitespace-normalized header
+    new_cols = [
+        _COLUMN_MAPPING.get(c)
+        or _NORMALIZED_MAPPING.get(c.replace('\r', '').replace('\n', ' ').strip())
+        or c
+        for c in table.column_names
+    ]
+    table = table.rename_columns(new_cols)
 
     # Enrich
-    df['Data_Source'] = source
-    if 'Region' not in df.columns:
-        df['Region'] = source
-    return df
+    table = set_column(table, 'Data_Source', constant_column(source, table.num_rows))
+    if 'Region' not in table.column_names:
+        table = table.append_column('Region', constant_column(source, table.num_rows))
+    return table
+
+
+def ingest(csv_path: Path, source: str,
+           cache: Optional[ParsedCsvCache] = None) -> Optional[Tuple[str, pa.Table]]:
+    """Read and normalize one source CSV; returns (station, table) or None if unreadable."""
+    try:
+        table = cache.read(csv_path) if cache is not None else read_csv_table(csv_path)
+        if not table.num_rows:
+            return None  # header-only export, nothing to contribute
+        table = normalize_columns(drop_unnamed(table), source)
+        # ensure station
+        if 'Station_Name' in table.column_names and table.column('Station_Name')[0].is_valid:
+            station = canonicalize_station_name(table.column('Station_Name')[0].as_py())
+        else:
+            # attempt from filename
+            parts = csv_path.stem.split('_')
+            station = canonicalize_station_name(parts[1] if len(parts) > 1 else csv_path.stem)
+        table = set_column(table, 'Station_Name', constant_column(station, table.num_rows))
+        return station, encode_categories(table)
+    except READ_ERRORS as e:
+        logger.warning(f"⚠️ Skipping {csv_path}: {e}")
+        return None
 
 
 def build_common_files():
@@ -90,82 +365,47 @@ def build_common_files():
     out_dir = base / 'common'
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    station_to_frames: Dict[str, List[pd.DataFrame]] = {}
+    station_to_frames: Dict[str, List[pa.Table]] = {}
 
-    # Ingest WRPC
-    if wrpc_dir.exists():
-        for csv_path in sorted(wrpc_dir.glob('*.csv')):
-            try:
-                df = pd.read_csv(csv_path, low_memory=False)
-                df = drop_unnamed(df)
-                df = normalize_columns(df, 'WRPC')
-                # ensure station
-                if 'Station_Name' in df.columns:
-                    station = canonicalize_station_name(df['Station_Name'].iloc[0])
-                else:
-                    station = canonicalize_station_name(csv_path.stem.split('_')[1])
-                df['Station_Name'] = station
-                station_to_frames.setdefault(station, []).append(df)
-            except Exception:
-                continue
-
-    # Ingest ERLDC
-    if erldc_dir.exists():
-        for csv_path in sorted(erldc_dir.glob('*.csv')):
-            try:
-                df = pd.read_csv(csv_path, low_memory=False)
-                df = drop_unnamed(df)
-                df = normalize_columns(df, 'ERLDC')
-                if 'Station_Name' in df.columns:
-                    station = canonicalize_station_name(df['Station_Name'].iloc[0])
-                else:
-                    # attempt from filename
-                    parts = csv_path.stem.split('_')
-                    station = canonicalize_station_name(parts[1] if len(parts) > 1 else csv_path.stem)
-                df['Station_Name'] = station
-                station_to_frames.setdefault(station, []).append(df)
-            except Exception:
-                continue
-
-    # Ingest SRPC
-    if srpc_dir.exists():
-        for csv_path in sorted(srpc_dir.glob('*.csv')):
-            try:
-                df = pd.read_csv(csv_path, low_memory=False)
-                df = drop_unnamed(df)
-                df = normalize_columns(df, 'SRPC')
-                if 'Station_Name' in df.columns:
-                    station = canonicalize_station_name(df['Station_Name'].iloc[0])
-                else:
-                    # attempt from filename
-                    parts = csv_path.stem.split('_')
-                    station = canonicalize_station_name(parts[1] if len(parts) > 1 else csv_path.stem)
-                df['Station_Name'] = station
-                station_to_frames.setdefault(station, []).append(df)
-            except Exception:
-                continue
-
-    # Write per-station common files
+    # One pool over all three sources; Arrow parsing releases the GIL, and
+    # map() keeps results in directory order so the output is deterministic
+    jobs = [(csv_path, source)
+            for source, src_dir in (('WRPC', wrpc_dir), ('ERLDC', erldc_dir), ('SRPC', srpc_dir))
+            if src_dir.exists()
+            for csv_path in sorted(src_dir.glob('*.csv'))]
+    # Unchanged CSVs are loaded from their cached Parquet instead of re-parsed
+    cache = ParsedCsvCache(out_dir)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for result in executor.map(lambda job: ingest(*job, cache=cache), jobs):
+            if result is not None:
+                station, table = result
+                station_to_frames.setdefault(station, []).append(table)
+    cache.save()
+
+    # Write per-station common files; directories are created up front, and
+    # the CSV opt-in is read once rather than per station
+    for station in station_to_frames:
+        (out_dir / station).mkdir(exist_ok=True)
+    write_csv = emit_csv()
     summary = []
     for station, frames in station_to_frames.items():
         try:
-            combined = pd.concat(frames, ignore_index=True, sort=False)
+            # Zero-copy chunked concat; sort and write stay in Arrow
+            combined = concat_tables(frames)
             # sort for readability
-            sort_cols = [c for c in ['Date', 'Time', 'Block'] if c in combined.columns]
+            sort_cols = [c for c in ['Date', 'Time', 'Block'] if c in combined.column_names]
             if sort_cols:
-                combined = combined.sort_values(sort_cols)
+                combined = combined.sort_by([(c, 'ascending') for c in sort_cols])
             # output
             station_dir = out_dir / station
-            station_dir.mkdir(parents=True, exist_ok=True)
             csv_out = station_dir / f"{station}_COMMON.csv"
             pq_out = station_dir / f"{station}_COMMON.parquet"
-            combined.to_csv(csv_out, index=False)
-            try:
-                combined.to_parquet(pq_out, index=False)
-            except Exception:
-                pass
-            summary.append({'station': station, 'rows': len(combined), 'files': len(frames)})
-        except Exception:
+            if write_csv:
+                pacsv.write_csv(combined, csv_out)
+            pq.write_table(combined, pq_out, **PARQUET_WRITE_OPTIONS)
+            summary.append({'station': station, 'rows': combined.num_rows, 'files': len(frames)})
+        except (pa.ArrowException, OSError) as e:
+            logger.warning(f"⚠️ Could not write common file for {station}: {e}")
             continue
 
     print(json.dumps({
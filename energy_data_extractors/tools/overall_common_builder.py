@@ -1,86 +1,214 @@
 #!/usr/bin/env python3
 import os
 import re
+import sys
 import json
-from glob import glob
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
+# Add repository root (parent of 'energy_data_extractors') to sys.path
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
 
+from energy_data_extractors.tools.common_station_builder import (
+    PARQUET_WRITE_OPTIONS, READ_ERRORS, ParsedCsvCache, align_to_schema, concat_tables, constant_column,
+    drop_unnamed, emit_csv, encode_categories, read_csv_table, set_column, unify_schemas,
+)
+
+logger = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def canonicalize_station_name(name: str) -> str:
     if name is None:
         return ''
     s = str(name).strip()
     s = s.replace('/', '_').replace('\\', '_')
-    s = re.sub(r"\s+", "_", s)
+    s = _WS_RE.sub("_", s)
     return s.upper()
 
 
-def drop_unnamed(df: pd.DataFrame) -> pd.DataFrame:
-    return df.loc[:, ~df.columns.str.startswith('Unnamed')]
-
-
-def load_common_station(station_dir: Path) -> pd.DataFrame:
-    csvs = sorted(station_dir.glob('*_COMMON.csv'))
-    frames: List[pd.DataFrame] = []
-    for p in csvs:
+def load_common_station(station_dir: Path) -> pa.Table:
+    # common_station_builder always writes Parquet; the CSV copy is opt-in
+    parquets = sorted(station_dir.glob('*_COMMON.parquet'))
+    frames: List[pa.Table] = []
+    for p in parquets:
         try:
-            df = pd.read_csv(p, low_memory=False)
-            frames.append(df)
-        except Exception:
+            frames.append(pq.read_table(p))
+        except (pa.ArrowException, OSError) as e:
+            logger.warning(f"⚠️ Skipping {p}: {e}")
             continue
-    return pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
+    return concat_tables(frames) if frames else pa.table({})
 
 
-def find_nrldc_files_for_station(nrldc_dir: Path, station: str) -> List[Path]:
-    # NRLDC files often start with NRLDC_{STATION}_*
-    pattern = f"NRLDC_{station}_*.csv"
-    return [Path(p) for p in glob(str(nrldc_dir / pattern))]
+def index_station_files(directory: Path, prefix: str, stations: Iterable[str]) -> Dict[str, List[Path]]:
+    """Map each station to its ``{prefix}_{STATION}_*.csv`` files (e.g. NRLDC_{STATION}_*)
+    with a single directory scan instead of one glob per station.
 
-def find_srpc_files_for_station(srpc_dir: Path, station: str) -> List[Path]:
-    # SRPC files often start with SRPC_{STATION}_*
-    pattern = f"SRPC_{station}_*.csv"
-    return [Path(p) for p in glob(str(srpc_dir / pattern))]
+    Station names can contain underscores themselves, so every ``_`` in the file
+    name is tried as the end of the station; a file is listed under each station
+    whose glob would have matched it.
+    """
+    stations = set(stations)
+    index: Dict[str, List[Path]] = {}
+    if not directory.exists():
+        return index
+    lead = f"{prefix}_"
+    with os.scandir(directory) as it:
+        for e in it:
+            if not (e.name.startswith(lead) and e.name.endswith('.csv')):
+                continue
+            body = e.name[len(lead):-len('.csv')]
+            for i, ch in enumerate(body):
+                if ch == '_' and body[:i] in stations:
+                    index.setdefault(body[:i], []).append(directory / e.name)
+    return index
 
 
-def load_nrldc_station(nrldc_dir: Path, station: str) -> pd.DataFrame:
-    files = find_nrldc_files_for_station(nrldc_dir, station)
-    frames: List[pd.DataFrame] = []
+def load_nrldc_station(files: List[Path], station: str, cache: Optional[ParsedCsvCache] = None) -> pa.Table:
+    read = cache.read if cache is not None else read_csv_table
+    frames: List[pa.Table] = []
     for p in files:
         try:
-            df = pd.read_csv(p, low_memory=False)
-            df = drop_unnamed(df)
-            df['Station_Name'] = station
-            if 'Region' not in df.columns:
-                df['Region'] = 'NRLDC'
-            if 'Data_Source' not in df.columns:
-                df['Data_Source'] = 'NRLDC'
-            frames.append(df)
-        except Exception:
+            table = drop_unnamed(read(p))
+            table = set_column(table, 'Station_Name', constant_column(station, table.num_rows))
+            if 'Region' not in table.column_names:
+                table = table.append_column('Region', constant_column('NRLDC', table.num_rows))
+            if 'Data_Source' not in table.column_names:
+                table = table.append_column('Data_Source', constant_column('NRLDC', table.num_rows))
+            frames.append(encode_categories(table))
+        except READ_ERRORS as e:
+            logger.warning(f"⚠️ Skipping {p}: {e}")
             continue
-    return pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
+    return concat_tables(frames) if frames else pa.table({})
 
-def load_srpc_station(srpc_dir: Path, station: str) -> pd.DataFrame:
-    files = find_srpc_files_for_station(srpc_dir, station)
-    frames: List[pd.DataFrame] = []
+def load_srpc_station(files: List[Path], station: str, cache: Optional[ParsedCsvCache] = None) -> pa.Table:
+    read = cache.read if cache is not None else read_csv_table
+    frames: List[pa.Table] = []
     for p in files:
         try:
-            df = pd.read_csv(p, low_memory=False)
-            df = drop_unnamed(df)
-            df['Station_Name'] = station
-            if 'Region' not in df.columns:
-                df['Region'] = 'SRPC'
-            if 'Data_Source' not in df.columns:
-                df['Data_Source'] = 'SRPC'
-            frames.append(df)
-        except Exception:
+            table = drop_unnamed(read(p))
+            table = set_column(table, 'Station_Name', constant_column(station, table.num_rows))
+            if 'Region' not in table.column_names:
+                table = table.append_column('Region', constant_column('SRPC', table.num_rows))
+            if 'Data_Source' not in table.column_names:
+                table = table.append_column('Data_Source', constant_column('SRPC', table.num_rows))
+            frames.append(encode_categories(table))
+        except READ_ERRORS as e:
+            logger.warning(f"⚠️ Skipping {p}: {e}")
             continue
-    return pd.concat(frames, ignore_index=True, sort=False) if frames else pd.DataFrame()
+    return concat_tables(frames) if frames else pa.table({})
 
 
-def build_overall_common():
+def build_station(station: str, common_dir: Path, nrldc_files: List[Path], srpc_files: List[Path], out_dir: Path,
+                  cache: Optional[ParsedCsvCache] = None, write_csv: bool = False) -> Optional[Tuple[dict, pa.Table]]:
+    """Merge one station's common, NRLDC and SRPC rows and write its overall file.
+
+    ``out_dir / station`` must already exist.
+
+    Returns the summary row and the written table, or None if the station has no data.
+    """
+    station_common_dir = common_dir / station
+    df_common = load_common_station(station_common_dir)
+    df_nrldc = load_nrldc_station(nrldc_files, station, cache)
+    df_srpc = load_srpc_station(srpc_files, station, cache)
+
+    frames = []
+    if df_common.num_rows:
+        # Add origin tag for clarity
+        if 'Origin' not in df_common.column_names:
+            origin = (df_common.column('Region') if 'Region' in df_common.column_names
+                      else constant_column('WRPC/ERLDC/SRPC', df_common.num_rows))
+            df_common = df_common.append_column('Origin', origin)
+        frames.append(encode_categories(df_common))
+    if df_nrldc.num_rows:
+        if 'Origin' not in df_nrldc.column_names:
+            df_nrldc = df_nrldc.append_column('Origin', constant_column('NRLDC', df_nrldc.num_rows))
+        frames.append(encode_categories(df_nrldc))
+    if df_srpc.num_rows:
+        if 'Origin' not in df_srpc.column_names:
+            df_srpc = df_srpc.append_column('Origin', constant_column('SRPC', df_srpc.num_rows))
+        frames.append(encode_categories(df_srpc))
+
+    if not frames:
+        return None
+
+    # Zero-copy chunked concat; sort and write stay in Arrow
+    combined = concat_tables(frames)
+
+    # Sort if possible
+    sort_cols = [c for c in ['Date', 'Time', 'Block', 'Sheet_Type'] if c in combined.column_names]
+    if sort_cols:
+        try:
+            combined = combined.sort_by([(c, 'ascending') for c in sort_cols])
+        except pa.ArrowException as e:
+            # e.g. a Block column that is text in some sources; keep source order
+            logger.warning(f"⚠️ Not sorting {station}: {e}")
+
+    station_dir = out_dir / station
+    csv_out = station_dir / f"{station}_OVERALL_COMMON.csv"
+    pq_out = station_dir / f"{station}_OVERALL_COMMON.parquet"
+    if write_csv:
+        pacsv.write_csv(combined, csv_out)
+    pq.write_table(combined, pq_out, **PARQUET_WRITE_OPTIONS)
+
+    return {
+        'station': station, 
+        'rows': combined.num_rows, 
+        'has_wrpc_erldc_srpc': int(df_common.num_rows > 0), 
+        'has_nrldc': int(df_nrldc.num_rows > 0),
+        'has_srpc': int(df_srpc.num_rows > 0)
+    }, combined
+
+
+# Label columns every overall table carries (see the loaders and build_station)
+_LABEL_SCHEMA = pa.schema([(c, pa.dictionary(pa.int32(), pa.string()))
+                           for c in ('Station_Name', 'Region', 'Data_Source', 'Origin')])
+
+
+def overall_schema(stations: List[str], common_dir: Path, nrldc_index: Dict[str, List[Path]],
+                   srpc_index: Dict[str, List[Path]], cache: Optional[ParsedCsvCache] = None) -> pa.Schema:
+    """Schema every station's overall table can be cast to, from the source schemas alone.
+
+    Common Parquet files only have their footer read; NRLDC/SRPC CSVs go through
+    the parsed-CSV cache, so the build that follows reads them from there.
+    """
+    schemas: List[pa.Schema] = []
+    for station in stations:
+        for p in sorted((common_dir / station).glob('*_COMMON.parquet')):
+            try:
+                schemas.append(pq.read_schema(p))
+            except (pa.ArrowException, OSError):
+                continue
+        schemas.append(_LABEL_SCHEMA)
+        for p in nrldc_index.get(station, []) + srpc_index.get(station, []):
+            try:
+                schema = cache.read_schema(p) if cache is not None else read_csv_table(p).schema
+            except READ_ERRORS:
+                continue
+            schemas.append(pa.schema([f for f in schema if not f.name.startswith('Unnamed')]))
+    return unify_schemas(schemas).remove_metadata()
+
+
+def iter_overall_common(summary: Optional[List[dict]] = None,
+                        unify: bool = False) -> Iterator[Tuple[str, pa.Table]]:
+    """Build every station's overall file, yielding (station, table) after each write.
+
+    Summary rows are appended to ``summary`` when given. With ``unify`` every
+    yielded table is cast to one schema covering all stations, so the stream
+    can feed a single ParquetWriter/CSVWriter.
+    """
     base = Path('local_data')
     common_dir = base / 'common'
     nrldc_dir = base / 'NRLDC'
@@ -92,61 +220,56 @@ def build_overall_common():
         print(json.dumps({'error': 'local_data/common not found. Run common_station_builder first.'}))
         return
 
-    stations = [d.name for d in common_dir.iterdir() if d.is_dir()]
+    with os.scandir(common_dir) as it:
+        # Hidden entries are the parsed-CSV cache, not stations
+        stations = sorted(e.name for e in it if e.is_dir() and not e.name.startswith('.'))
+
+    # One listing per source directory, shared by all stations
+    nrldc_index = index_station_files(nrldc_dir, 'NRLDC', stations)
+    srpc_index = index_station_files(srpc_dir, 'SRPC', stations)
 
-    summary = []
+    # Output directories are created once here rather than by every worker
     for station in stations:
-        station_common_dir = common_dir / station
-        df_common = load_common_station(station_common_dir)
-        df_nrldc = load_nrldc_station(nrldc_dir, station) if nrldc_dir.exists() else pd.DataFrame()
-        df_srpc = load_srpc_station(srpc_dir, station) if srpc_dir.exists() else pd.DataFrame()
-
-        frames = []
-        if not df_common.empty:
-            # Add origin tag for clarity
-            if 'Origin' not in df_common.columns:
-                df_common['Origin'] = df_common.get('Region', 'WRPC/ERLDC/SRPC')
-            frames.append(df_common)
-        if not df_nrldc.empty:
-            if 'Origin' not in df_nrldc.columns:
-                df_nrldc['Origin'] = 'NRLDC'
-            frames.append(df_nrldc)
-        if not df_srpc.empty:
-            if 'Origin' not in df_srpc.columns:
-                df_srpc['Origin'] = 'SRPC'
-            frames.append(df_srpc)
-
-        if not frames:
-            continue
+        (out_dir / station).mkdir(exist_ok=True)
+    write_csv = emit_csv()
 
-        combined = pd.concat(frames, ignore_index=True, sort=False)
+    # Shares common_station_builder's manifest, so unchanged NRLDC/SRPC CSVs are not re-parsed
+    cache = ParsedCsvCache(common_dir)
+    schema = overall_schema(stations, common_dir, nrldc_index, srpc_index, cache) if unify else None
 
-        # Sort if possible
-        sort_cols = [c for c in ['Date', 'Time', 'Block', 'Sheet_Type'] if c in combined.columns]
-        if sort_cols:
-            try:
-                combined = combined.sort_values(sort_cols)
-            except Exception:
-                pass
-
-        station_dir = out_dir / station
-        station_dir.mkdir(parents=True, exist_ok=True)
-        csv_out = station_dir / f"{station}_OVERALL_COMMON.csv"
-        pq_out = station_dir / f"{station}_OVERALL_COMMON.parquet"
-        combined.to_csv(csv_out, index=False)
-        try:
-            combined.to_parquet(pq_out, index=False)
-        except Exception:
-            pass
-
-        summary.append({
-            'station': station, 
-            'rows': len(combined), 
-            'has_wrpc_erldc_srpc': int(not df_common.empty), 
-            'has_nrldc': int(not df_nrldc.empty),
-            'has_srpc': int(not df_srpc.empty)
-        })
+    # Stations are independent; Arrow reads/writes release the GIL so threads
+    # overlap the IO. Results come back in station order, and at most 2x workers
+    # finished tables wait for the consumer, so memory does not grow with the
+    # number of stations.
+    def take(future):
+        result = future.result()
+        if result is None:
+            return
+        row, table = result
+        if summary is not None:
+            summary.append(row)
+        yield row['station'], align_to_schema(table, schema) if schema is not None else table
+
+    workers = os.cpu_count() or 1
+    pending = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for station in stations:
+                pending.append(executor.submit(
+                    build_station, station, common_dir, nrldc_index.get(station, []),
+                    srpc_index.get(station, []), out_dir, cache, write_csv))
+                if len(pending) > 2 * workers:
+                    yield from take(pending.popleft())
+            while pending:
+                yield from take(pending.popleft())
+    finally:
+        cache.save()
 
+
+def build_overall_common():
+    summary: List[dict] = []
+    for _ in iter_overall_common(summary):
+        pass
     print(json.dumps({'stations': len(summary), 'details': summary[:20]}, indent=2))
 
 
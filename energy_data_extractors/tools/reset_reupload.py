@@ -5,9 +5,16 @@ from pathlib import Path
 from datetime import datetime
 import argparse
 import json
+from typing import Iterable, Tuple
+from contextlib import ExitStack
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import boto3
-import pandas as pd
+from botocore.config import Config
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 # Ensure repo root on path
 # Add repository root (parent of 'energy_data_extractors') to sys.path
@@ -18,63 +25,128 @@ if str(REPO_ROOT) not in sys.path:
 from energy_data_extractors.common.auto_s3_upload import AutoS3Uploader
 from energy_data_extractors.run_pipeline import run_extractors
 from energy_data_extractors.tools.common_station_builder import build_common_files as build_wrpc_erldc_common
-from energy_data_extractors.tools.overall_common_builder import build_overall_common as build_overall
+from energy_data_extractors.tools.common_station_builder import (
+    PARQUET_WRITE_OPTIONS, emit_csv, unify_schemas,
+)
+from energy_data_extractors.tools.overall_common_builder import iter_overall_common
+
+
+DELETE_WORKERS = 16
+
+
+def _delete_batch(s3_client, bucket: str, batch: list) -> int:
+    resp = s3_client.delete_objects(Bucket=bucket, Delete={'Objects': batch, 'Quiet': True})
+    # Quiet mode only reports failures
+    return len(batch) - len(resp.get('Errors', []))
 
 
 def delete_s3_prefix(bucket: str, prefix: str, region: str | None = None) -> dict:
     session = boto3.session.Session(region_name=region)
-    s3 = session.resource('s3')
-    bucket_obj = s3.Bucket(bucket)
+    s3_client = session.client('s3', config=Config(max_pool_connections=DELETE_WORKERS))
+    paginator = s3_client.get_paginator('list_objects_v2')
 
     deleted = 0
-    to_delete = bucket_obj.objects.filter(Prefix=prefix)
-    batch = []
-    for obj in to_delete:
-        batch.append({'Key': obj.key})
-        if len(batch) == 1000:
-            bucket_obj.delete_objects(Delete={'Objects': batch})
-            deleted += len(batch)
-            batch = []
-    if batch:
-        bucket_obj.delete_objects(Delete={'Objects': batch})
-        deleted += len(batch)
+    pending = set()
+    # Listing stays sequential (continuation tokens); each 1000-key page is deleted
+    # on the pool while the next page is fetched. In-flight batches are bounded.
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            batch = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+            if not batch:
+                continue
+            pending.add(executor.submit(_delete_batch, s3_client, bucket, batch))
+            if len(pending) >= 2 * DELETE_WORKERS:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                deleted += sum(f.result() for f in done)
+        deleted += sum(f.result() for f in pending)
     return {"deleted": deleted, "prefix": prefix}
 
 
-def combine_overall_common(output_dir: Path) -> dict:
+def combine_overall_common(output_dir: Path, tables: Iterable[Tuple[str, pa.Table]] | None = None) -> dict:
+    """Concatenate the per-station overall files into common_all_stations.*.
+
+    ``tables`` is a (station, table) stream such as
+    iter_overall_common(unify=True); when given, each table is appended to the
+    combined writers as it is built instead of re-scanning ``output_dir``.
+    """
+    if tables is not None:
+        return _write_combined(output_dir, tables)
     if not output_dir.exists():
         return {"combined_rows": 0, "files": 0, "output": None}
 
-    frames: list[pd.DataFrame] = []
-    files = 0
-    for station_dir in sorted([d for d in output_dir.iterdir() if d.is_dir()]):
-        for f in station_dir.glob('*.csv'):
+    pq_files: list[str] = []
+    schemas: list[pa.Schema] = []
+    # One scandir per level; DirEntry.is_dir/is_file use the readdir type, no extra stat
+    with os.scandir(output_dir) as it:
+        station_dirs = sorted(e.path for e in it if e.is_dir())
+    for station_dir in station_dirs:
+        # The builders always write Parquet; per-station CSVs only exist with EMIT_CSV=1
+        with os.scandir(station_dir) as it:
+            station_files = [e.path for e in it
+                             if e.name.endswith('.parquet') and not e.name.startswith('.') and e.is_file()]
+        for f in station_files:
             try:
-                df = pd.read_csv(f)
-                frames.append(df)
-                files += 1
-            except Exception:
+                # Footer only; unreadable files are skipped before the scan starts
+                schemas.append(pq.read_schema(f))
+                pq_files.append(f)
+            except (pa.ArrowException, OSError) as e:
+                print(f"Skipping unreadable {f}: {e}")
                 continue
 
-    if not frames:
+    if not pq_files:
         return {"combined_rows": 0, "files": 0, "output": None}
 
-    combined = pd.concat(frames, ignore_index=True)
+    # The dataset scan fills missing columns with nulls and casts to the unified
+    # schema, so batches stream straight into both writers: memory stays flat
+    # however many stations there are.
+    schema = unify_schemas(schemas).remove_metadata()
+    dataset = ds.dataset(pq_files, schema=schema, format='parquet')
     output_dir.mkdir(parents=True, exist_ok=True)
     combined_csv = output_dir / 'common_all_stations.csv'
     combined_parquet = output_dir / 'common_all_stations.parquet'
 
-    # Write CSV
-    combined.to_csv(combined_csv, index=False)
-    # Write Parquet (coerce non-bytes to strings where needed)
-    try:
-        combined.to_parquet(combined_parquet, index=False, engine='pyarrow')
-    except Exception:
-        for col in combined.select_dtypes(include=['object']).columns:
-            combined[col] = combined[col].astype(str)
-        combined.to_parquet(combined_parquet, index=False, engine='pyarrow')
+    # Same opt-in as the per-station CSVs; downstream reads the Parquet
+    write_csv = emit_csv()
+    rows = 0
+    with ExitStack() as stack:
+        writers = [stack.enter_context(pq.ParquetWriter(combined_parquet, schema, **PARQUET_WRITE_OPTIONS))]
+        if write_csv:
+            writers.append(stack.enter_context(pacsv.CSVWriter(combined_csv, schema)))
+        for batch in dataset.to_batches(batch_size=131072):
+            for writer in writers:
+                writer.write_batch(batch)
+            rows += batch.num_rows
 
-    return {"combined_rows": len(combined), "files": files, "output": str(combined_csv)}
+    output = combined_csv if write_csv else combined_parquet
+    return {"combined_rows": rows, "files": len(pq_files), "output": str(output)}
+
+
+def _write_combined(output_dir: Path, tables: Iterable[Tuple[str, pa.Table]]) -> dict:
+    combined_csv = output_dir / 'common_all_stations.csv'
+    combined_parquet = output_dir / 'common_all_stations.parquet'
+    write_csv = emit_csv()
+    rows = files = 0
+    with ExitStack() as stack:
+        writers = None
+        # Each station table is appended and dropped; the writers take the first
+        # table's schema, which iter_overall_common(unify=True) gives every table.
+        for _, table in tables:
+            table = table.replace_schema_metadata(None)
+            if writers is None:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                writers = [stack.enter_context(
+                    pq.ParquetWriter(combined_parquet, table.schema, **PARQUET_WRITE_OPTIONS))]
+                if write_csv:
+                    writers.append(stack.enter_context(pacsv.CSVWriter(combined_csv, table.schema)))
+            for writer in writers:
+                writer.write_table(table)
+            rows += table.num_rows
+            files += 1
+
+    if not files:
+        return {"combined_rows": 0, "files": 0, "output": None}
+    output = combined_csv if write_csv else combined_parquet
+    return {"combined_rows": rows, "files": files, "output": str(output)}
 
 
 def main():
@@ -115,13 +187,14 @@ def main():
     print('STEP 2: Build station-common from WRPC/ERLDC')
     build_wrpc_erldc_common()
 
+    # Steps 3 and 4 run as one stream: each station's overall table is appended
+    # to the combined file right after its own file is written
     print('STEP 3: Build overall per-station (including NRLDC/SRPC/NERPC if matching)')
-    build_overall()
-
-    # Build combined common file locally
     print('STEP 4: Build combined common file for all stations locally')
     overall_dir = REPO_ROOT / 'local_data' / 'overall_common'
-    combine_res = combine_overall_common(overall_dir)
+    overall_summary: list[dict] = []
+    combine_res = combine_overall_common(overall_dir, iter_overall_common(overall_summary, unify=True))
+    print(json.dumps({'stations': len(overall_summary), 'details': overall_summary[:20]}, indent=2))
 
     result = {
         "s3": summary,